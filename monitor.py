@@ -1,29 +1,84 @@
 import argparse
 import asyncio
-import json
+import atexit
 import logging
-import time
-from collections import defaultdict
-from typing import Any, Dict, Optional, Tuple
-from urllib.parse import urlparse
+import os
+import queue
+import re
+from dataclasses import dataclass
+from logging.handlers import QueueHandler, QueueListener
+from time import monotonic
+from typing import Any, Dict, Optional, Tuple, cast
 
 import aiohttp
+import numpy as np
+import orjson
 import yaml
 
+try:
+    # Use the libyaml bindings when available, they are much faster
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader  # type: ignore[assignment]
+
+try:
+    # Use the libuv based event loop when available, it is faster than asyncio's
+    import uvloop
+except ImportError:  # uvloop does not support Windows
+    uvloop = None  # type: ignore[assignment]
+
+# Log records are queued and written to the console by a background thread, so
+# the health checks never block on console I/O.
+log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s - %(levelname)s - %(message)s",
     handlers=[
-        logging.StreamHandler(),
+        QueueHandler(log_queue),
     ],
 )
+log_listener = QueueListener(log_queue, logging.StreamHandler())
+log_listener.start()
+atexit.register(log_listener.stop)
 
 logger = logging.getLogger(__name__)
 
 REQUEST_TIMEOUT = 0.5  # Default timeout is 0.5 seconds (500ms)
+CLIENT_TIMEOUT = aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
 MONITOR_INTERVAL = 15
 MIN_SUCCESS_STATUS_CODE = 200
 MAX_SUCCESS_STATUS_CODE = 299
+STATUS_DOWN = 0
+STATUS_UP = 1
+HTTP_METHOD_NOT_ALLOWED = 405
+CIRCUIT_BREAKER_THRESHOLD = 3  # Consecutive failures before checks are skipped
+MAX_SKIPPED_CYCLES = 20  # 5 minutes at the default interval
+MAX_CONNECTIONS = 100
+MAX_CONNECTIONS_PER_HOST = 20
+KEEPALIVE_TIMEOUT = 60
+DNS_CACHE_TTL = 300
+
+# Scheme, optional userinfo, then the host up to the port, path, query or fragment
+DOMAIN_PATTERN = re.compile(r"^[A-Za-z][A-Za-z0-9+.-]*://(?:[^@/?#]*@)?([^:/?#]*)")
+
+
+@dataclass(slots=True)
+class Endpoint:
+    """
+    An endpoint with its request fields precomputed from the configuration, so
+    health checks read attributes instead of re-parsing the configuration.
+    """
+
+    name: str
+    url: str
+    domain: str
+    dom_id: int  # Index of the domain in the monitor's availability arrays
+    method: str
+    method_configured: bool
+    headers: Dict[str, Any]
+    body: Optional[bytes]  # Serialized JSON, None to send no body
+    fail_streak: int = 0
+    skip_cycles: int = 0
 
 
 def validate_endpoint_config(endpoint: Dict[str, Any]) -> bool:
@@ -32,25 +87,113 @@ def validate_endpoint_config(endpoint: Dict[str, Any]) -> bool:
     return True
 
 
+def get_config_cache_path(file_path: str) -> str:
+    """
+    Get the path of the JSON cache kept next to a YAML configuration file.
+    Args:
+        file_path (str): Path to the YAML configuration file.
+    Returns:
+        str: Path to the JSON cache file.
+    """
+    return os.path.splitext(file_path)[0] + ".cache.json"
+
+
+def read_config_cache(
+    cache_path: str, file_stat: os.stat_result
+) -> Optional[list[Dict[str, Any]]]:
+    """
+    Read the JSON cache of a YAML configuration file if it was written for the
+    current version of the YAML file.
+    Args:
+        cache_path (str): Path to the JSON cache file.
+        file_stat (os.stat_result): Stat of the YAML configuration file.
+    Returns:
+        Optional[list[Dict[str, Any]]]: List of endpoints if the cache is fresh, None otherwise.
+    """
+    try:
+        with open(cache_path, "rb") as file:
+            cache = orjson.loads(file.read())
+    except (OSError, orjson.JSONDecodeError):
+        return None
+
+    # Compare against the stat recorded in the cache rather than the cache's own
+    # mtime, so restoring an older YAML file (mv, cp -p) still invalidates it
+    if (
+        not isinstance(cache, dict)
+        or cache.get("mtime_ns") != file_stat.st_mtime_ns
+        or cache.get("size") != file_stat.st_size
+    ):
+        return None
+
+    return cache.get("config")
+
+
+def write_config_cache(
+    cache_path: str, file_stat: os.stat_result, config: list[Dict[str, Any]]
+) -> None:
+    """
+    Write the validated configuration to its JSON cache.
+    Args:
+        cache_path (str): Path to the JSON cache file.
+        file_stat (os.stat_result): Stat of the YAML configuration file.
+        config (list[Dict[str, Any]]): List of endpoint configurations to cache.
+    """
+    try:
+        cache = orjson.dumps(
+            {
+                "mtime_ns": file_stat.st_mtime_ns,
+                "size": file_stat.st_size,
+                "config": config,
+            },
+            # Raise on YAML dates instead of turning them into strings, so
+            # configs JSON can't round-trip are never cached
+            option=orjson.OPT_PASSTHROUGH_DATETIME,
+        )
+        with open(cache_path, "wb") as file:
+            file.write(cache)
+    except (OSError, orjson.JSONEncodeError):  # e.g. non-string keys or dates
+        logger.warning(f"Unable to write configuration cache: {cache_path}")
+
+
 # Function to load configuration from the YAML file
-def load_config(file_path: str) -> Optional[list[Dict[str, Any]]]:
+def load_config(file_path: str) -> Optional[tuple[Endpoint, ...]]:
     """
-    Load configuration from a YAML file.
+    Load configuration from a YAML file, or from its JSON cache when the cache
+    was written for the current version of the YAML file.
     Args:
         file_path (str): Path to the YAML configuration file.
     Returns:
-        Optional[list[Dict[str, Any]]]: List of endpoints if successful, None otherwise.
+        Optional[tuple[Endpoint, ...]]: Tuple of endpoints if successful, None otherwise.
     """
+    cache_path = get_config_cache_path(file_path)
+    file_stat: Optional[os.stat_result]
     try:
-        with open(file_path, "r") as file:
-            config = yaml.safe_load(file)
+        file_stat = os.stat(file_path)
+    except OSError:
+        file_stat = None  # Skip the cache and let open() report the error
+
+    try:
+        config = read_config_cache(cache_path, file_stat) if file_stat else None
+        from_cache = config is not None
+
+        if config is None:
+            with open(file_path, "r") as file:
+                config = yaml.load(file, Loader=SafeLoader)
+
+        for endpoint_config in config:
+            if not validate_endpoint_config(endpoint_config):
+                logger.error(f"Invalid endpoint configuration: name or url missing")
+                return None
+
+        domain_ids: Dict[str, int] = {}
+        endpoints = tuple(
+            create_endpoint(endpoint_config, domain_ids) for endpoint_config in config
+        )
 
-            for endpoint in config:
-                if not validate_endpoint_config(endpoint):
-                    logger.error(f"Invalid endpoint configuration: name or url missing")
-                    return None
+        if file_stat and not from_cache:
+            write_config_cache(cache_path, file_stat, config)
 
-            return config
+        return endpoints
 
     except FileNotFoundError:
         logger.error(f"Configuration file not found: {file_path}")
@@ -58,6 +201,9 @@ def load_config(file_path: str) -> Optional[list[Dict[str, Any]]]:
     except yaml.YAMLError:
         logger.error(f"Error parsing YAML file: {file_path}")
         return None
+    except orjson.JSONDecodeError:
+        logger.error("Invalid endpoint configuration: body is not valid JSON")
+        return None
 
 
 def parse_domain(url: str) -> str:
@@ -68,38 +214,111 @@ def parse_domain(url: str) -> str:
     Returns:
         str: The domain name.
     """
-    parsed_url = urlparse(url)
-    domain = parsed_url.netloc
+    match = DOMAIN_PATTERN.match(url)
 
-    return domain.split(":")[0]
+    return match.group(1) if match else ""
 
 
-# Function to perform health checks
-async def check_health(
-    session: aiohttp.ClientSession, endpoint: Dict[str, Any]
-) -> Tuple[str, str]:
+def create_endpoint(
+    endpoint_config: Dict[str, Any], domain_ids: Dict[str, int]
+) -> Endpoint:
     """
-    Perform a health check on the given endpoint.
+    Create an endpoint from its configuration, precomputing the request fields
+    so health checks don't re-parse static configuration every cycle.
+    Args:
+        endpoint_config (Dict[str, Any]): The endpoint configuration.
+        domain_ids (Dict[str, int]): Ids of the domains seen so far, updated in place.
+    Returns:
+        Endpoint: The endpoint.
+    """
+    domain = parse_domain(endpoint_config["url"])
+    # Default to HEAD, the response status is all a health check needs. Endpoints
+    # with a body default to GET, since servers may reject content on HEAD.
+    default_method = "GET" if "body" in endpoint_config else "HEAD"
+    method = endpoint_config.get("method", default_method).upper()
+    headers = endpoint_config.get("headers") or {}  # `headers:` may be left empty
+
+    # HEAD and GET requests without a configured body are sent without one
+    body = None
+    if "body" in endpoint_config or method not in ("HEAD", "GET"):
+        # Validate and serialize the body once instead of on every request
+        body = orjson.dumps(orjson.loads(endpoint_config.get("body", "{}")))
+        # The body is sent pre-serialized, so set the content type aiohttp would
+        # otherwise add for a JSON body
+        if not any(
+            isinstance(key, str) and key.lower() == "content-type" for key in headers
+        ):
+            headers = {**headers, "Content-Type": "application/json"}
+
+    return Endpoint(
+        name=endpoint_config["name"],
+        url=endpoint_config["url"],  # Always a valid URL
+        domain=domain,
+        # Domains are numbered in order of first appearance
+        dom_id=domain_ids.setdefault(domain, len(domain_ids)),
+        method=method,
+        method_configured="method" in endpoint_config,
+        headers=headers,
+        body=body,
+    )
+
+
+def create_resolver() -> aiohttp.abc.AbstractResolver:
+    """
+    Create the DNS resolver for the connection pool.
+    Returns:
+        aiohttp.abc.AbstractResolver: An aiodns based resolver when aiodns is installed,
+            otherwise a resolver running getaddrinfo in a thread pool.
+    """
+    try:
+        return aiohttp.AsyncResolver()
+    except RuntimeError:  # aiodns is not installed
+        return aiohttp.ThreadedResolver()
+
+
+# Function to send the health check request
+async def request_health(
+    session: aiohttp.ClientSession,
+    endpoint: Endpoint,
+    start_time: Optional[float] = None,
+) -> Tuple[int, int]:
+    """
+    Send a health check request to the given endpoint.
     Args:
         session (aiohttp.ClientSession): The session to use for the request.
-        endpoint (Dict[str, Any]): The endpoint to check.
+        endpoint (Endpoint): The endpoint to check.
+        start_time (Optional[float]): When the check started, if this request is a
+            retry. The response time covers every request made for the check.
     Returns:
-        Tuple[str, str]: A tuple containing the status and domain.
+        Tuple[int, int]: A tuple containing the status (STATUS_UP or STATUS_DOWN)
+            and domain id.
     """
-    name = endpoint["name"]
-    url = endpoint["url"]  # Always a valid URL
-    domain = parse_domain(url)
-    method = endpoint.get("method", "GET").upper()  # Default to GET if not specified
-    headers = endpoint.get("headers", {})
-    body = json.loads(endpoint.get("body", "{}"))  # Always a valid JSON object
+    name = endpoint.name
+    dom_id = endpoint.dom_id
+    method = endpoint.method
 
-    start_time = time.time()
+    if start_time is None:
+        start_time = monotonic()
 
     try:
         async with session.request(
-            method, url, headers=headers, json=body, timeout=REQUEST_TIMEOUT
+            method,
+            endpoint.url,
+            headers=endpoint.headers,
+            data=endpoint.body,
+            timeout=CLIENT_TIMEOUT,
         ) as response:
-            response_time = time.time() - start_time
+            response_time = monotonic() - start_time
+
+            if (
+                response.status == HTTP_METHOD_NOT_ALLOWED
+                and method == "HEAD"
+                and not endpoint.method_configured
+            ):
+                # HEAD is not supported, use GET for this and all future checks
+                logger.info(f"Endpoint '{name}' does not allow HEAD, using GET")
+                endpoint.method = "GET"
+                return await request_health(session, endpoint, start_time)
 
             if (
                 MIN_SUCCESS_STATUS_CODE <= response.status <= MAX_SUCCESS_STATUS_CODE
@@ -108,7 +327,7 @@ async def check_health(
                 logger.info(
                     f"Endpoint '{name}' is UP (Status Code: {response.status}, Response Time: {response_time:.3f}s)"
                 )
-                return "UP", domain
+                return STATUS_UP, dom_id
             else:
                 reason = (
                     f"Response time exceeded {REQUEST_TIMEOUT * 1000}ms"
@@ -116,65 +335,180 @@ async def check_health(
                     else f"Status code: {response.status}"
                 )
                 logger.info(f"Endpoint '{name}' is DOWN ({reason})")
-                return "DOWN", domain
+                return STATUS_DOWN, dom_id
     except asyncio.TimeoutError:
         logger.info(
             f"Endpoint '{name}' is DOWN (Response time exceeded {REQUEST_TIMEOUT * 1000}ms)"
         )
-        return "DOWN", domain
+        return STATUS_DOWN, dom_id
     except Exception as e:
         logger.error(f"Endpoint '{name}' is DOWN (Exception: {str(e)})")
-        return "DOWN", domain
+        return STATUS_DOWN, dom_id
+
+
+# Function to perform health checks
+async def check_health(
+    session: aiohttp.ClientSession, endpoint: Endpoint
+) -> Tuple[int, int]:
+    """
+    Perform a health check on the given endpoint. Endpoints that keep failing are
+    skipped for an exponentially growing number of cycles and counted as DOWN.
+    Args:
+        session (aiohttp.ClientSession): The session to use for the request.
+        endpoint (Endpoint): The endpoint to check.
+    Returns:
+        Tuple[int, int]: A tuple containing the status (STATUS_UP or STATUS_DOWN)
+            and domain id.
+    """
+    if endpoint.skip_cycles:
+        endpoint.skip_cycles -= 1
+        logger.info(
+            f"Endpoint '{endpoint.name}' is DOWN (Skipped after {endpoint.fail_streak} consecutive failures)"
+        )
+        return STATUS_DOWN, endpoint.dom_id
+
+    status, dom_id = await request_health(session, endpoint)
+
+    if status == STATUS_UP:
+        endpoint.fail_streak = 0
+    else:
+        endpoint.fail_streak += 1
+        backoff = endpoint.fail_streak - CIRCUIT_BREAKER_THRESHOLD
+        if backoff >= 0:
+            endpoint.skip_cycles = min(2**backoff, MAX_SKIPPED_CYCLES)
+
+    return status, dom_id
+
+
+# Function to perform a health check once a connection slot is free
+async def check_health_limited(
+    session: aiohttp.ClientSession,
+    endpoint: Endpoint,
+    semaphore: asyncio.Semaphore,
+) -> Tuple[int, int]:
+    """
+    Perform a health check while holding the semaphore, so requests queue for
+    the connection pool instead of all racing for sockets at once.
+    Args:
+        session (aiohttp.ClientSession): The session to use for the request.
+        endpoint (Endpoint): The endpoint to check.
+        semaphore (asyncio.Semaphore): Limits the number of in-flight requests.
+    Returns:
+        Tuple[int, int]: A tuple containing the status (STATUS_UP or STATUS_DOWN)
+            and domain id.
+    """
+    async with semaphore:
+        return await check_health(session, endpoint)
 
 
 # Function to check all endpoints in parallel
-async def check_all_endpoints(endpoints: list[Dict[str, Any]]) -> list[Tuple[str, str]]:
+async def check_all_endpoints(
+    session: aiohttp.ClientSession,
+    endpoints: tuple[Endpoint, ...],
+    semaphore: asyncio.Semaphore,
+) -> list[Tuple[int, int]]:
     """
     Check all endpoints in parallel using asyncio.
 
     Args:
-        endpoints (list[Dict[str, Any]]): List of endpoint configurations.
+        session (aiohttp.ClientSession): The shared session to use for the requests.
+        endpoints (tuple[Endpoint, ...]): Tuple of endpoints.
+        semaphore (asyncio.Semaphore): Limits the number of in-flight requests.
 
     Returns:
-        list[Tuple[str, str]]: List of (status, domain) tuples.
+        list[Tuple[int, int]]: List of (status, domain id) tuples.
     """
-    async with aiohttp.ClientSession() as session:
-        tasks = [check_health(session, endpoint) for endpoint in endpoints]
-        return await asyncio.gather(*tasks)
+    tasks = [
+        check_health_limited(session, endpoint, semaphore) for endpoint in endpoints
+    ]
+    return await asyncio.gather(*tasks)
 
 
 # Main function to monitor endpoints
-async def monitor_endpoints(file_path: str) -> None:
+async def monitor_endpoints(
+    file_path: str, max_connections: int = MAX_CONNECTIONS
+) -> None:
     """
     Monitor the availability of endpoints based on a YAML configuration file.
     Args:
         file_path (str): Path to the YAML configuration file.
+        max_connections (int): Maximum number of concurrent requests.
     """
     config = load_config(file_path)
     if not config:
         return
 
-    domain_stats = defaultdict(lambda: {"up": 0, "total": 0})
-
-    while True:
-        start_time = time.time()
-
-        results = await check_all_endpoints(config)
-
-        for status, domain in results:
-            domain_stats[domain]["total"] += 1
-            if status == "UP":
-                domain_stats[domain]["up"] += 1
-
-        # Log cumulative availability percentages
-        for domain, stats in domain_stats.items():
-            availability = round(100 * stats["up"] / stats["total"])
-            logger.info(f"{domain} has {availability}% availability percentage")
-
-        elapsed_time = time.time() - start_time
-        sleep_time = max(MONITOR_INTERVAL - elapsed_time, 0)
-        logger.info("---")
-        time.sleep(sleep_time)
+    # Domain names indexed by the domain ids assigned in load_config
+    domains = list(dict.fromkeys(endpoint.domain for endpoint in config))
+    domain_ids = np.fromiter(
+        (endpoint.dom_id for endpoint in config), np.intp, len(config)
+    )
+    # Every endpoint is checked every cycle, so the totals grow by a fixed amount
+    cycle_total = np.bincount(domain_ids, minlength=len(domains))
+    domain_up = np.zeros(len(domains), np.int64)
+    domain_total = np.zeros(len(domains), np.int64)
+
+    # Keep one session (and its connection pool) for the lifetime of the monitor
+    # so keep-alive connections can be reused across cycles. aiohttp only speaks
+    # HTTP/1.1, so endpoints on the same host each hold their own pooled
+    # connection rather than sharing a multiplexed HTTP/2 one. KEEPALIVE_TIMEOUT
+    # only keeps the client side open past the monitor interval; a connection is
+    # reused on the next cycle when the server also keeps it open that long,
+    # otherwise it is reopened.
+    connector = aiohttp.TCPConnector(
+        limit=max_connections,
+        limit_per_host=MAX_CONNECTIONS_PER_HOST,
+        keepalive_timeout=KEEPALIVE_TIMEOUT,
+        resolver=create_resolver(),
+        use_dns_cache=True,
+        ttl_dns_cache=DNS_CACHE_TTL,
+    )
+    semaphore = asyncio.Semaphore(max_connections)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        loop = asyncio.get_running_loop()
+        next_run = loop.time()
+
+        while True:
+            results = await check_all_endpoints(session, config, semaphore)
+
+            is_up = np.fromiter(
+                (status for status, _ in results), np.bool_, len(results)
+            )
+            domain_total += cycle_total
+            domain_up += np.bincount(domain_ids[is_up], minlength=len(domains))
+
+            # Log cumulative availability percentages. Every domain is updated
+            # each cycle, so all of them are logged in a single pass over plain
+            # Python ints rather than per-element NumPy scalars.
+            availability = cast(
+                list[int],
+                np.rint(100 * domain_up / domain_total).astype(np.int64).tolist(),
+            )
+            for domain, percentage in zip(domains, availability):
+                logger.info(f"{domain} has {percentage}% availability percentage")
+
+            # Schedule against a fixed timeline so drift doesn't accumulate,
+            # restarting it if a cycle overran the interval.
+            next_run = max(next_run + MONITOR_INTERVAL, loop.time())
+            logger.info("---")
+            await asyncio.sleep(next_run - loop.time())
+
+
+def positive_int(value: str) -> int:
+    """
+    Parse a command line argument that must be a positive integer.
+    Args:
+        value (str): The argument value.
+    Returns:
+        int: The parsed value.
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
 
 
 # Entry point of the program
@@ -186,9 +520,17 @@ if __name__ == "__main__":
         "config_file", type=str, help="Path to the YAML configuration file."
     )
 
+    parser.add_argument(
+        "--max-connections",
+        type=positive_int,
+        default=MAX_CONNECTIONS,
+        help=f"Maximum number of concurrent requests (default: {MAX_CONNECTIONS}).",
+    )
+
     args = parser.parse_args()
 
     try:
-        asyncio.run(monitor_endpoints(args.config_file))
+        run = uvloop.run if uvloop else asyncio.run
+        run(monitor_endpoints(args.config_file, args.max_connections))
     except KeyboardInterrupt:
         logger.info("\nMonitoring stopped by user.")